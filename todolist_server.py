@@ -1,13 +1,42 @@
 import asyncio
+import bisect
+import hashlib
+import heapq
 import json
 import os
 import logging
+import re
 from datetime import datetime, date
-from typing import List, Optional, Dict, Any, Union
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Union, Annotated, Literal
 from fastmcp import FastMCP
-import aiofiles
 import shutil
 
+# Use orjson for JSON parsing/serialization when available (Rust-accelerated,
+# several times faster than stdlib on typical dict payloads), falling back to
+# stdlib json otherwise. Both helpers work on bytes to avoid an extra UTF-8
+# decode/encode roundtrip.
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    def _dumps_compact(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    def _dumps_compact(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -16,6 +45,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger("TodoListServer")
 
+
+def _sync_read(path: str) -> bytes:
+    """Read a file's contents in one shot (runs in a worker thread)."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _sync_write(path: str, data: bytes) -> int:
+    """Write a file atomically via a temp file + os.replace (runs in a worker thread).
+
+    Returns the written file's st_mtime_ns for cache validation.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return os.stat(path).st_mtime_ns
+
+
+def _normalize_todo(todo: dict) -> dict:
+    """Fill in default fields so a stored todo matches the response shape."""
+    todo.setdefault("description", "")
+    todo.setdefault("due_date", None)
+    todo.setdefault("status", "pending")
+    todo.setdefault("priority", "medium")
+    todo.setdefault("tags", [])
+    todo.setdefault("created_at", None)
+    todo.setdefault("updated_at", None)
+    return todo
+
+
+def _sync_append(path: str, data: bytes) -> int:
+    """Append bytes to a file (runs in a worker thread).
+
+    Returns the file's st_mtime_ns for cache validation.
+    """
+    with open(path, "ab") as f:
+        f.write(data)
+        # Flush the buffered write first or the fstat sees the pre-append
+        # mtime, which would spuriously invalidate the cache on every read
+        f.flush()
+        return os.fstat(f.fileno()).st_mtime_ns
+
 # Get todo file path from environment variable or use default
 TODO_FILE = os.environ.get("TODO_FILE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "todos.json"))
 BACKUP_DIR = os.environ.get("TODO_BACKUP_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "backups"))
@@ -23,11 +95,67 @@ BACKUP_DIR = os.environ.get("TODO_BACKUP_DIR", os.path.join(os.path.dirname(os.p
 # Ensure backup directory exists
 os.makedirs(BACKUP_DIR, exist_ok=True)
 
-# Valid status values
-VALID_STATUSES = ["pending", "in_progress", "done", "cancelled"]
+# Due dates must look like YYYY-MM-DD and be real calendar dates
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+@lru_cache(maxsize=2048)
+def _is_valid_date(date_str: str) -> bool:
+    """Check that a string is a valid YYYY-MM-DD date.
+
+    The regex rejects malformed input cheaply; date.fromisoformat (C-level,
+    far faster than strptime) confirms calendar validity. Results are
+    memoized since the same dates recur across validations.
+    """
+    if not _DATE_RE.match(date_str):
+        return False
+    try:
+        date.fromisoformat(date_str)
+        return True
+    except ValueError:
+        return False
+
+# Valid status values: ordered tuple for stable display, frozenset for O(1)
+# membership checks, and error strings built once instead of per request
+STATUS_VALUES = ("pending", "in_progress", "done", "cancelled")
+VALID_STATUSES = frozenset(STATUS_VALUES)
+VALID_STATUSES_ERR = f"Status must be one of: {', '.join(STATUS_VALUES)}"
+INVALID_STATUS_ERR = f"Invalid status. Must be one of: {', '.join(STATUS_VALUES)}"
+
+# Sort keys specialized per field once at import time, rather than closing
+# over sort_by inside every list_todos call
+SORT_FIELDS = ("id", "title", "due_date", "status", "priority", "created_at", "updated_at")
+_SORT_KEYS = {field: (lambda f: lambda t: t.get(f, ""))(field) for field in SORT_FIELDS}
+INVALID_SORT_ERR = f"Invalid sort_by. Must be one of: {', '.join(SORT_FIELDS)}"
 
 # Valid priority values
-VALID_PRIORITIES = ["low", "medium", "high", "critical"]
+PRIORITY_VALUES = ("low", "medium", "high", "critical")
+VALID_PRIORITIES = frozenset(PRIORITY_VALUES)
+VALID_PRIORITIES_ERR = f"Priority must be one of: {', '.join(PRIORITY_VALUES)}"
+INVALID_PRIORITY_ERR = f"Invalid priority. Must be one of: {', '.join(PRIORITY_VALUES)}"
+
+# When msgspec is available, a typed Struct validates well-formed todos in a
+# single C pass. It is only used as an accept fast path: anything it rejects
+# falls through to the Python validator, which stays authoritative so error
+# messages (and behavior without msgspec) are unchanged.
+try:
+    import msgspec
+
+    class _TodoSpec(msgspec.Struct, kw_only=True):
+        """Typed mirror of a todo dict with the documented field constraints."""
+        id: int = 0
+        title: Annotated[str, msgspec.Meta(min_length=1, max_length=100)]
+        description: Annotated[str, msgspec.Meta(max_length=1000)] = ""
+        due_date: Optional[Annotated[str, msgspec.Meta(pattern=r"^\d{4}-\d{2}-\d{2}$")]] = None
+        status: Literal["pending", "in_progress", "done", "cancelled"] = "pending"
+        priority: Literal["low", "medium", "high", "critical"] = "medium"
+        tags: List[str] = []
+        created_at: Optional[str] = None
+        updated_at: Optional[str] = None
+except ImportError:
+    msgspec = None
+    _TodoSpec = None
+
 
 class TodoManager:
     """Manager class for todo operations"""
@@ -36,58 +164,232 @@ class TodoManager:
         """Initialize the TodoManager with file path and backup directory"""
         self.file_path = file_path
         self.backup_dir = backup_dir
+        self._log_path = file_path + ".log"
         self._todos_cache = None
-        self._last_load_time = None
-    
+        self._file_mtime_ns = None
+        self._log_mtime_ns = None
+        self._last_payload_hash = None
+        self._backup_task = None
+        self._by_id = {}
+        self._by_status = {}
+        self._by_priority = {}
+        self._by_tag = {}
+        self._search_lc = {}
+        self._due_sorted = []
+        self._no_date = set()
+        self._next_id = 1
+
+    def _stat_mtimes(self) -> tuple:
+        """Return (snapshot, log) st_mtime_ns, with None for missing files"""
+        try:
+            file_mtime = os.stat(self.file_path).st_mtime_ns
+        except OSError:
+            file_mtime = None
+        try:
+            log_mtime = os.stat(self._log_path).st_mtime_ns
+        except OSError:
+            log_mtime = None
+        return file_mtime, log_mtime
+
     async def _load_todos(self, force_reload: bool = False) -> List[dict]:
         """Load todos from file with caching"""
-        current_time = datetime.now()
-        
-        # Use cache if available and not forced to reload
-        if not force_reload and self._todos_cache is not None and self._last_load_time is not None:
-            # Cache for 5 seconds
-            if (current_time - self._last_load_time).total_seconds() < 5:
-                return self._todos_cache.copy()
-        
+        # The cache is valid iff neither file changed on disk: a stat costs
+        # about a microsecond vs a full JSON parse, and unlike a TTL there
+        # is no staleness window when an external writer touches the file
+        mtimes = await asyncio.to_thread(self._stat_mtimes)
+        if not force_reload and self._todos_cache is not None:
+            if mtimes == (self._file_mtime_ns, self._log_mtime_ns):
+                return self._todos_cache
+
         try:
-            if not os.path.exists(self.file_path):
-                logger.info(f"Todo file not found at {self.file_path}. Creating new file.")
-                self._todos_cache = []
-                self._last_load_time = current_time
-                return []
-            
-            async with aiofiles.open(self.file_path, mode="r") as f:
-                content = await f.read()
+            todos = []
+            snapshot_next_id = 1
+            if os.path.exists(self.file_path):
+                content = await asyncio.to_thread(_sync_read, self.file_path)
                 try:
-                    todos = json.loads(content)
-                    self._todos_cache = todos
-                    self._last_load_time = current_time
-                    return todos.copy()
-                except json.JSONDecodeError as e:
+                    loaded = _loads(content)
+                    # Snapshots carry a header with the id counter; plain
+                    # lists from older files are still accepted
+                    if isinstance(loaded, dict):
+                        todos = loaded.get("todos", [])
+                        snapshot_next_id = loaded.get("next_id", 1)
+                    else:
+                        todos = loaded
+                except ValueError as e:
                     logger.error(f"Error decoding JSON: {e}")
                     # If file exists but is corrupted, create backup
                     await self._create_backup(suffix="corrupted")
-                    self._todos_cache = []
-                    self._last_load_time = current_time
-                    return []
+                    todos = []
+            else:
+                logger.info(f"Todo file not found at {self.file_path}. Creating new file.")
+
+            # Replay any operations logged since the last snapshot
+            log_max_id = 0
+            if os.path.exists(self._log_path):
+                log_content = await asyncio.to_thread(_sync_read, self._log_path)
+                todos, log_max_id = self._replay_log(todos, log_content)
+
+            self._next_id = max(snapshot_next_id,
+                                max((t["id"] for t in todos), default=0) + 1,
+                                log_max_id + 1)
+            # Normalize once at load so responses can use stored dicts as-is
+            for todo in todos:
+                _normalize_todo(todo)
+            self._todos_cache = todos
+            self._rebuild_indexes(todos)
+            # Record the pre-read mtimes: if a writer raced the read we'll
+            # simply reload on the next call
+            self._file_mtime_ns, self._log_mtime_ns = mtimes
+            return todos
         except Exception as e:
             logger.error(f"Error loading todos: {e}")
             self._todos_cache = []
-            self._last_load_time = current_time
+            self._rebuild_indexes([])
+            self._file_mtime_ns = None
+            self._log_mtime_ns = None
             return []
     
+    def _replay_log(self, todos: List[dict], log_content: bytes) -> tuple:
+        """Apply the append-only operation log on top of a snapshot.
+
+        Returns (todos, max_id), where max_id is the highest id seen in any
+        logged operation — deletes included, so ids are never reused even if
+        the latest adds were deleted before the next compaction.
+        """
+        by_id = {t["id"]: t for t in todos}
+        max_id = 0
+        for line in log_content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                op = _loads(line)
+            except ValueError as e:
+                logger.error(f"Skipping corrupted log entry: {e}")
+                continue
+            kind = op.get("op")
+            if kind in ("add", "update"):
+                todo = op["todo"]
+                by_id[todo["id"]] = todo
+                max_id = max(max_id, todo["id"])
+            elif kind == "delete":
+                for todo_id in op.get("ids", [op.get("id")]):
+                    by_id.pop(todo_id, None)
+                    if todo_id:
+                        max_id = max(max_id, todo_id)
+        return list(by_id.values()), max_id
+
+    async def _append_op(self, op: dict) -> bool:
+        """Append a single operation to the log; O(1) bytes per mutation"""
+        try:
+            self._log_mtime_ns = await asyncio.to_thread(
+                _sync_append, self._log_path, _dumps_compact(op) + b"\n")
+            return True
+        except Exception as e:
+            logger.error(f"Error appending to todo log: {e}")
+            return False
+
+    async def _maybe_compact(self) -> None:
+        """Compact once the log outgrows the snapshot (2x threshold)"""
+        try:
+            log_size = os.path.getsize(self._log_path)
+            snapshot_size = os.path.getsize(self.file_path) if os.path.exists(self.file_path) else 0
+        except OSError:
+            return
+        if log_size > 2 * snapshot_size:
+            await self.compact()
+
+    async def compact(self) -> bool:
+        """Write a fresh snapshot and truncate the operation log"""
+        todos = self._todos_cache if self._todos_cache is not None else await self._load_todos()
+        if not await self._save_todos(todos):
+            return False
+        try:
+            await asyncio.to_thread(os.remove, self._log_path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Error truncating todo log: {e}")
+            return False
+        self._log_mtime_ns = None
+        return True
+
+    def _index_todo(self, todo: dict) -> None:
+        """Add a todo to the lookup indexes"""
+        todo_id = todo["id"]
+        self._by_id[todo_id] = todo
+        self._by_status.setdefault(todo.get("status", "pending"), set()).add(todo_id)
+        self._by_priority.setdefault(todo.get("priority", "medium"), set()).add(todo_id)
+        for tag in todo.get("tags", []):
+            self._by_tag.setdefault(tag, set()).add(todo_id)
+        # Cache one lowercased haystack per todo so search queries don't
+        # re-lower title/description on every call and only need a single
+        # C-level substring check; the newline separator prevents matches
+        # spanning the title/description boundary
+        self._search_lc[todo_id] = (todo.get("title", "").lower() + "\n" +
+                                    todo.get("description", "").lower())
+        due_date = todo.get("due_date")
+        if due_date:
+            bisect.insort(self._due_sorted, (due_date, todo_id))
+        else:
+            self._no_date.add(todo_id)
+
+    def _unindex_todo(self, todo: dict) -> None:
+        """Remove a todo from the lookup indexes"""
+        todo_id = todo["id"]
+        self._by_id.pop(todo_id, None)
+        self._search_lc.pop(todo_id, None)
+        due_date = todo.get("due_date")
+        if due_date:
+            i = bisect.bisect_left(self._due_sorted, (due_date, todo_id))
+            if i < len(self._due_sorted) and self._due_sorted[i] == (due_date, todo_id):
+                del self._due_sorted[i]
+        else:
+            self._no_date.discard(todo_id)
+        self._by_status.get(todo.get("status", "pending"), set()).discard(todo_id)
+        self._by_priority.get(todo.get("priority", "medium"), set()).discard(todo_id)
+        for tag in todo.get("tags", []):
+            self._by_tag.get(tag, set()).discard(todo_id)
+
+    def _due_range(self, today: str) -> tuple:
+        """Return (lo, hi) positions bracketing today's date in _due_sorted"""
+        lo = bisect.bisect_left(self._due_sorted, today, key=lambda e: e[0])
+        hi = bisect.bisect_right(self._due_sorted, today, key=lambda e: e[0])
+        return lo, hi
+
+    def _rebuild_indexes(self, todos: List[dict]) -> None:
+        """Rebuild the id/status/priority/tag indexes from scratch"""
+        self._by_id = {}
+        self._by_status = {}
+        self._by_priority = {}
+        self._by_tag = {}
+        self._search_lc = {}
+        self._due_sorted = []
+        self._no_date = set()
+        for todo in todos:
+            self._index_todo(todo)
+
     async def _save_todos(self, todos: List[dict]) -> bool:
         """Save todos to file and update cache"""
         try:
-            # Create backup before saving
-            await self._create_backup()
-            
-            async with aiofiles.open(self.file_path, mode="w") as f:
-                await f.write(json.dumps(todos, indent=2))
-            
+            # Snapshot header carries the id counter so restarts never
+            # reuse an id, even after trailing deletes
+            payload = _dumps({"next_id": self._next_id, "todos": todos})
+            payload_hash = hashlib.blake2b(payload).digest()
+
+            # Skip the write entirely if the file already holds these bytes
+            if payload_hash == self._last_payload_hash:
+                self._todos_cache = todos
+                return True
+
+            # Back up off the response path; the atomic write below means a
+            # failed backup can no longer leave a half-written todos file
+            self._backup_task = asyncio.create_task(self._create_backup())
+
+            self._file_mtime_ns = await asyncio.to_thread(_sync_write, self.file_path, payload)
+            self._last_payload_hash = payload_hash
+
             # Update cache
-            self._todos_cache = todos.copy()
-            self._last_load_time = datetime.now()
+            self._todos_cache = todos
             return True
         except Exception as e:
             logger.error(f"Error saving todos: {e}")
@@ -106,9 +408,30 @@ class TodoManager:
         try:
             # Ensure backup directory exists
             os.makedirs(self.backup_dir, exist_ok=True)
-            
-            # Copy the file
-            shutil.copy2(self.file_path, backup_path)
+
+            # Hardlink instead of copying: an O(1) metadata op, and safe
+            # because the snapshot is only ever replaced atomically (never
+            # modified in place), so the link keeps the old bytes
+            counter = 0
+            while True:
+                try:
+                    os.link(self.file_path, backup_path)
+                    break
+                except FileExistsError:
+                    # Timestamps have 1-second resolution, so same-second
+                    # backups collide. If the existing backup already links
+                    # to the current snapshot it is the backup we wanted;
+                    # otherwise retry with a uniquified name.
+                    if os.path.samefile(self.file_path, backup_path):
+                        return backup_path
+                    counter += 1
+                    backup_path = os.path.join(
+                        self.backup_dir,
+                        f"todos_backup_{timestamp}{suffix_str}_{counter}.json")
+                except OSError:
+                    # Cross-device link or unsupported filesystem
+                    shutil.copy2(self.file_path, backup_path)
+                    break
             logger.info(f"Created backup at {backup_path}")
             return backup_path
         except Exception as e:
@@ -119,63 +442,77 @@ class TodoManager:
         """Validate date string format (YYYY-MM-DD)"""
         if not date_str:
             return True
-            
-        try:
-            datetime.strptime(date_str, "%Y-%m-%d")
-            return True
-        except ValueError:
-            return False
-    
-    def _validate_todo(self, todo: dict) -> List[str]:
-        """Validate todo data and return list of errors"""
-        errors = []
-        
+        return _is_valid_date(date_str)
+    
+    def _validate_todo(self, todo: dict) -> tuple:
+        """Validate todo data and return a tuple of errors (empty when valid)"""
+        # Fast path: one C-level pass accepts well-formed todos (the common
+        # case). The regex in _TodoSpec only checks shape, so calendar
+        # validity still goes through the cached date check.
+        if _TodoSpec is not None:
+            try:
+                msgspec.convert(todo, _TodoSpec)
+            except msgspec.ValidationError:
+                pass  # fall through for the documented per-field messages
+            else:
+                due_date = todo.get("due_date")
+                if not due_date or _is_valid_date(due_date):
+                    return ()
+
+        # Each field is fetched once and the error list is only allocated on
+        # the first failure, so valid todos (the common case) allocate nothing
+        errors = None
+
         # Validate title
-        if not todo.get("title"):
-            errors.append("Title is required")
-        elif len(todo.get("title", "")) > 100:
-            errors.append("Title must be less than 100 characters")
-        
+        title = todo.get("title")
+        if not title:
+            errors = ["Title is required"]
+        elif len(title) > 100:
+            errors = ["Title must be less than 100 characters"]
+
         # Validate description
-        if len(todo.get("description", "")) > 1000:
+        description = todo.get("description")
+        if description and len(description) > 1000:
+            errors = errors or []
             errors.append("Description must be less than 1000 characters")
-        
+
         # Validate due date
-        if todo.get("due_date") and not self._validate_date(todo.get("due_date")):
+        due_date = todo.get("due_date")
+        if due_date and not self._validate_date(due_date):
+            errors = errors or []
             errors.append("Due date must be in YYYY-MM-DD format")
-        
+
         # Validate status
-        if todo.get("status") and todo.get("status") not in VALID_STATUSES:
-            errors.append(f"Status must be one of: {', '.join(VALID_STATUSES)}")
-        
+        status = todo.get("status")
+        if status and status not in VALID_STATUSES:
+            errors = errors or []
+            errors.append(VALID_STATUSES_ERR)
+
         # Validate priority
-        if todo.get("priority") and todo.get("priority") not in VALID_PRIORITIES:
-            errors.append(f"Priority must be one of: {', '.join(VALID_PRIORITIES)}")
-        
+        priority = todo.get("priority")
+        if priority and priority not in VALID_PRIORITIES:
+            errors = errors or []
+            errors.append(VALID_PRIORITIES_ERR)
+
         # Validate tags
-        if todo.get("tags") and not isinstance(todo.get("tags"), list):
+        tags = todo.get("tags")
+        if tags and not isinstance(tags, list):
+            errors = errors or []
             errors.append("Tags must be a list")
-        
-        return errors
+
+        return tuple(errors) if errors else ()
     
     def _serialize_todo(self, todo: dict) -> dict:
         """Serialize todo object for output"""
-        return {
-            "id": todo["id"],
-            "title": todo["title"],
-            "description": todo.get("description", ""),
-            "due_date": todo.get("due_date"),
-            "status": todo.get("status", "pending"),
-            "priority": todo.get("priority", "medium"),
-            "tags": todo.get("tags", []),
-            "created_at": todo.get("created_at"),
-            "updated_at": todo.get("updated_at")
-        }
+        # Stored todos are normalized to the full response shape at load and
+        # insert time, so no per-call projection dict is needed
+        return todo
     
     async def add_todo(self, title: str, description: str = "", due_date: Optional[str] = None,
                       status: str = "pending", priority: str = "medium", tags: List[str] = None) -> Dict[str, Any]:
         """Add a new todo item"""
         # Validate inputs
+        now_iso = datetime.now().isoformat()
         todo = {
             "title": title,
             "description": description,
@@ -183,8 +520,8 @@ class TodoManager:
             "status": status,
             "priority": priority,
             "tags": tags or [],
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
+            "created_at": now_iso,
+            "updated_at": now_iso
         }
         
         validation_errors = self._validate_todo(todo)
@@ -192,17 +529,18 @@ class TodoManager:
             return {"success": False, "errors": validation_errors}
         
         # Load existing todos
-        todos = await self._load_todos(force_reload=True)
+        todos = await self._load_todos()
         
-        # Generate new ID
-        todo_id = max([t["id"] for t in todos], default=0) + 1
+        # Generate new ID from the monotonic counter (O(1), never reused)
+        todo_id = self._next_id
+        self._next_id += 1
         todo["id"] = todo_id
         
-        # Add new todo
-        todos.append(todo)
-        
-        # Save todos
-        if await self._save_todos(todos):
+        # Log the add and apply it in memory
+        if await self._append_op({"op": "add", "todo": todo}):
+            self._todos_cache.append(todo)
+            self._index_todo(todo)
+            await self._maybe_compact()
             return {"success": True, "todo": self._serialize_todo(todo)}
         else:
             return {"success": False, "errors": ["Failed to save todo"]}
@@ -213,53 +551,76 @@ class TodoManager:
                         sort_order: str = "asc", limit: int = 100, offset: int = 0) -> Dict[str, Any]:
         """List todos with filtering, sorting and pagination"""
         todos = await self._load_todos()
-        filtered_todos = todos.copy()
-        
-        # Apply filters
+
+        # Validate filter values up front
+        if status and status not in VALID_STATUSES:
+            return {"success": False, "errors": [INVALID_STATUS_ERR]}
+        if priority and priority not in VALID_PRIORITIES:
+            return {"success": False, "errors": [INVALID_PRIORITY_ERR]}
+
+        # Narrow by the indexed filters first: intersect the id sets, then
+        # resolve ids back to todos, so only matching entries are scanned below
+        id_sets = []
         if status:
-            if status not in VALID_STATUSES:
-                return {"success": False, "errors": [f"Invalid status. Must be one of: {', '.join(VALID_STATUSES)}"]}
-            filtered_todos = [t for t in filtered_todos if t.get("status") == status]
-        
+            id_sets.append(self._by_status.get(status, set()))
         if priority:
-            if priority not in VALID_PRIORITIES:
-                return {"success": False, "errors": [f"Invalid priority. Must be one of: {', '.join(VALID_PRIORITIES)}"]}
-            filtered_todos = [t for t in filtered_todos if t.get("priority") == priority]
-        
-        if search:
-            search_lower = search.lower()
-            filtered_todos = [t for t in filtered_todos if 
-                             search_lower in t.get("title", "").lower() or 
-                             search_lower in t.get("description", "").lower()]
-        
+            id_sets.append(self._by_priority.get(priority, set()))
         if tag:
-            filtered_todos = [t for t in filtered_todos if tag in t.get("tags", [])]
-        
+            id_sets.append(self._by_tag.get(tag, set()))
         if due_date_filter:
-            today = date.today().isoformat()
-            
-            if due_date_filter == "overdue":
-                filtered_todos = [t for t in filtered_todos if t.get("due_date") and t.get("due_date") < today]
-            elif due_date_filter == "today":
-                filtered_todos = [t for t in filtered_todos if t.get("due_date") == today]
-            elif due_date_filter == "upcoming":
-                filtered_todos = [t for t in filtered_todos if t.get("due_date") and t.get("due_date") > today]
-            elif due_date_filter == "no_date":
-                filtered_todos = [t for t in filtered_todos if not t.get("due_date")]
+            if due_date_filter == "no_date":
+                id_sets.append(self._no_date)
+            elif due_date_filter in ("overdue", "today", "upcoming"):
+                lo, hi = self._due_range(date.today().isoformat())
+                if due_date_filter == "overdue":
+                    entries = self._due_sorted[:lo]
+                elif due_date_filter == "today":
+                    entries = self._due_sorted[lo:hi]
+                else:
+                    entries = self._due_sorted[hi:]
+                id_sets.append({i for _, i in entries})
             else:
                 return {"success": False, "errors": ["Invalid due_date_filter. Must be one of: overdue, today, upcoming, no_date"]}
-        
-        # Apply sorting
-        valid_sort_fields = ["id", "title", "due_date", "status", "priority", "created_at", "updated_at"]
-        if sort_by not in valid_sort_fields:
-            return {"success": False, "errors": [f"Invalid sort_by. Must be one of: {', '.join(valid_sort_fields)}"]}
-        
+
+        if id_sets:
+            filtered_todos = [self._by_id[i] for i in set.intersection(*id_sets)]
+        else:
+            filtered_todos = todos
+
+        # Single scan for the remaining (unindexed) search predicate; when no
+        # candidate narrowing happened, scan the lowercase cache directly so
+        # the loop does one dict lookup per todo instead of two
+        if search:
+            search_lower = search.lower()
+            search_lc = self._search_lc
+            if id_sets:
+                filtered_todos = [t for t in filtered_todos
+                                  if search_lower in search_lc[t["id"]]]
+            else:
+                by_id = self._by_id
+                filtered_todos = [by_id[i] for i, haystack in search_lc.items()
+                                  if search_lower in haystack]
+
+        # Apply sorting with the per-field precompiled key
+        sort_key = _SORT_KEYS.get(sort_by)
+        if sort_key is None:
+            return {"success": False, "errors": [INVALID_SORT_ERR]}
+
         reverse = sort_order.lower() == "desc"
-        filtered_todos.sort(key=lambda x: x.get(sort_by, ""), reverse=reverse)
-        
-        # Apply pagination
+
+        # Apply pagination; when only a small prefix is needed, a heap
+        # selection is O(N log k) instead of sorting everything
         total_count = len(filtered_todos)
-        paginated_todos = filtered_todos[offset:offset + limit]
+        end = offset + limit
+        if 0 < end < total_count // 2:
+            if reverse:
+                paginated_todos = heapq.nlargest(end, filtered_todos, key=sort_key)[offset:]
+            else:
+                paginated_todos = heapq.nsmallest(end, filtered_todos, key=sort_key)[offset:]
+        else:
+            # sorted() rather than .sort(): filtered_todos may alias the
+            # shared cache list when no filters were applied
+            paginated_todos = sorted(filtered_todos, key=sort_key, reverse=reverse)[offset:end]
         
         # Serialize todos
         serialized_todos = [self._serialize_todo(t) for t in paginated_todos]
@@ -274,12 +635,12 @@ class TodoManager:
     
     async def get_todo(self, todo_id: int) -> Dict[str, Any]:
         """Get a todo by id"""
-        todos = await self._load_todos()
-        
-        for todo in todos:
-            if todo["id"] == todo_id:
-                return {"success": True, "todo": self._serialize_todo(todo)}
-        
+        await self._load_todos()
+
+        todo = self._by_id.get(todo_id)
+        if todo is not None:
+            return {"success": True, "todo": self._serialize_todo(todo)}
+
         return {"success": False, "errors": [f"Todo {todo_id} not found"]}
     
     async def update_todo(self, todo_id: int, title: Optional[str] = None, 
@@ -287,20 +648,15 @@ class TodoManager:
                          status: Optional[str] = None, priority: Optional[str] = None,
                          tags: Optional[List[str]] = None) -> Dict[str, Any]:
         """Update a todo by id"""
-        todos = await self._load_todos(force_reload=True)
-        
+        todos = await self._load_todos()
+
         # Find todo by id
-        todo_index = None
-        for i, todo in enumerate(todos):
-            if todo["id"] == todo_id:
-                todo_index = i
-                break
-        
-        if todo_index is None:
+        old_todo = self._by_id.get(todo_id)
+        if old_todo is None:
             return {"success": False, "errors": [f"Todo {todo_id} not found"]}
-        
+
         # Create updated todo
-        updated_todo = todos[todo_index].copy()
+        updated_todo = old_todo.copy()
         
         # Update fields if provided
         if title is not None:
@@ -324,11 +680,17 @@ class TodoManager:
         if validation_errors:
             return {"success": False, "errors": validation_errors}
         
-        # Update todo in list
-        todos[todo_index] = updated_todo
-        
-        # Save todos
-        if await self._save_todos(todos):
+        # Log the update and apply it in memory; locate the slot by identity
+        # rather than list.index, which compares full dicts per element
+        if await self._append_op({"op": "update", "todo": updated_todo}):
+            cache = self._todos_cache
+            for i, t in enumerate(cache):
+                if t is old_todo:
+                    cache[i] = updated_todo
+                    break
+            self._unindex_todo(old_todo)
+            self._index_todo(updated_todo)
+            await self._maybe_compact()
             return {"success": True, "todo": self._serialize_todo(updated_todo)}
         else:
             return {"success": False, "errors": ["Failed to save todo"]}
@@ -339,35 +701,46 @@ class TodoManager:
     
     async def delete_todo(self, todo_id: int) -> Dict[str, Any]:
         """Delete a todo by id"""
-        todos = await self._load_todos(force_reload=True)
-        
+        todos = await self._load_todos()
+
         # Find todo by id
-        original_length = len(todos)
-        new_todos = [t for t in todos if t["id"] != todo_id]
-        
-        if len(new_todos) == original_length:
+        old_todo = self._by_id.get(todo_id)
+        if old_todo is None:
             return {"success": False, "errors": [f"Todo {todo_id} not found"]}
-        
-        # Save todos
-        if await self._save_todos(new_todos):
+
+        # Log the delete and apply it in memory; locate the slot by identity
+        # rather than list.remove, which compares full dicts per element
+        if await self._append_op({"op": "delete", "id": todo_id}):
+            cache = self._todos_cache
+            for i, t in enumerate(cache):
+                if t is old_todo:
+                    del cache[i]
+                    break
+            self._unindex_todo(old_todo)
+            await self._maybe_compact()
             return {"success": True, "message": f"Todo {todo_id} deleted"}
         else:
             return {"success": False, "errors": ["Failed to save todos"]}
     
     async def batch_delete_todos(self, todo_ids: List[int]) -> Dict[str, Any]:
         """Delete multiple todos by ids"""
-        todos = await self._load_todos(force_reload=True)
-        
-        # Find todos by ids
-        original_length = len(todos)
-        new_todos = [t for t in todos if t["id"] not in todo_ids]
+        todos = await self._load_todos()
         
-        deleted_count = original_length - len(new_todos)
+        # Find todos by ids: O(M) index lookups instead of an O(N*M) scan
+        ids_set = frozenset(todo_ids)
+        removed_todos = [self._by_id[i] for i in ids_set if i in self._by_id]
+
+        deleted_count = len(removed_todos)
         if deleted_count == 0:
             return {"success": False, "errors": ["No matching todos found"]}
-        
-        # Save todos
-        if await self._save_todos(new_todos):
+
+        # Log the deletes and apply them in memory
+        removed_ids = [t["id"] for t in removed_todos]
+        if await self._append_op({"op": "delete", "ids": removed_ids}):
+            self._todos_cache = [t for t in self._todos_cache if t["id"] not in ids_set]
+            for todo in removed_todos:
+                self._unindex_todo(todo)
+            await self._maybe_compact()
             return {"success": True, "message": f"{deleted_count} todos deleted"}
         else:
             return {"success": False, "errors": ["Failed to save todos"]}
@@ -387,30 +760,25 @@ class TodoManager:
         
         # Count by status
         status_counts = {}
-        for status in VALID_STATUSES:
-            status_counts[status] = len([t for t in todos if t.get("status") == status])
-        
+        for status in STATUS_VALUES:
+            status_counts[status] = len(self._by_status.get(status, ()))
+
         # Count by priority
         priority_counts = {}
-        for priority in VALID_PRIORITIES:
-            priority_counts[priority] = len([t for t in todos if t.get("priority") == priority])
-        
-        # Count by due date
-        today = date.today().isoformat()
-        overdue_count = len([t for t in todos if t.get("due_date") and t.get("due_date") < today])
-        due_today_count = len([t for t in todos if t.get("due_date") == today])
-        upcoming_count = len([t for t in todos if t.get("due_date") and t.get("due_date") > today])
-        no_date_count = len([t for t in todos if not t.get("due_date")])
-        
-        # Get all tags
-        all_tags = set()
-        for todo in todos:
-            all_tags.update(todo.get("tags", []))
-        
-        # Count by tag
-        tag_counts = {}
-        for tag in all_tags:
-            tag_counts[tag] = len([t for t in todos if tag in t.get("tags", [])])
+        for priority in PRIORITY_VALUES:
+            priority_counts[priority] = len(self._by_priority.get(priority, ()))
+        
+        # Count by due date: bisect the sorted (due_date, id) structure
+        # instead of rescanning the list once per bucket
+        lo, hi = self._due_range(date.today().isoformat())
+        overdue_count = lo
+        due_today_count = hi - lo
+        upcoming_count = len(self._due_sorted) - hi
+        no_date_count = len(self._no_date)
+        
+        # Count by tag straight from the tag index (one rescan per tag
+        # before); skip tags whose todos have all been deleted
+        tag_counts = {tag: len(ids) for tag, ids in self._by_tag.items() if ids}
         
         return {
             "success": True,